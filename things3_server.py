@@ -5,12 +5,21 @@ Provides Model Context Protocol interface for Things 3 task management on macOS
 """
 
 import asyncio
+import functools
+import inspect
 import json
-import subprocess
 import sys
+import time
+import uuid
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # optional; parses large results faster than json
+    orjson = None
+
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
@@ -50,331 +59,701 @@ class Project:
             self.tasks = []
 
 
+# Markers used to frame results coming back from the osascript worker
+_RESULT_OK = "<<OK>>"
+_RESULT_ERR = "<<ERR>>"
+
+# Appended to every fixed script when it is compiled into a worker; calls the
+# script's invoke handler and tags the outcome, so errors come back on stdout
+_TAGGED_HANDLER = f'''
+on tagged(argv)
+    try
+        return "{_RESULT_OK}" & my invoke(argv)
+    on error errMsg
+        return "{_RESULT_ERR}" & errMsg
+    end try
+end tagged
+'''
+
+
+def _applescript_string(value: str) -> str:
+    """Quote a Python string as a single-line AppleScript string literal"""
+    escaped = (value.replace("\\", "\\\\")
+                    .replace('"', '\\"')
+                    .replace("\n", "\\n")
+                    .replace("\r", "\\r"))
+    return f'"{escaped}"'
+
+
+# Parser for the JSON produced by the read scripts
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# AppleScript handlers that render values as JSON, shared by the read scripts
+_JSON_HANDLERS = r'''
+on replaceText(theText, searchText, replacementText)
+    set AppleScript's text item delimiters to searchText
+    set textItems to text items of theText
+    set AppleScript's text item delimiters to replacementText
+    set theText to textItems as text
+    set AppleScript's text item delimiters to ""
+    return theText
+end replaceText
+
+-- {character, JSON escape} pairs, built on first use; backslash comes first so
+-- the escapes added by later pairs are not escaped again
+property escapePairs : missing value
+
+on jsonEscapes()
+    if escapePairs is missing value then
+        set pairs to {{"\\", "\\\\"}, {quote, "\\" & quote}, {linefeed, "\\n"}, {return, "\\r"}, {tab, "\\t"}}
+        -- Any other raw control character (e.g. a pasted vertical tab) would
+        -- make the JSON invalid, so those become \u00XX escapes
+        repeat with codePoint from 0 to 31
+            if codePoint is not in {9, 10, 13} then
+                set end of pairs to {character id codePoint, "\\u00" & ¬
+                    (character (codePoint div 16 + 1) of "01") & ¬
+                    (character (codePoint mod 16 + 1) of "0123456789abcdef")}
+            end if
+        end repeat
+        set escapePairs to pairs
+    end if
+    return escapePairs
+end jsonEscapes
+
+-- For free text (names, notes); only characters actually present are replaced
+on jsonString(value)
+    if value is missing value then return "null"
+    set value to value as text
+    repeat with escapePair in jsonEscapes()
+        if value contains (item 1 of escapePair) then
+            set value to replaceText(value, item 1 of escapePair, item 2 of escapePair)
+        end if
+    end repeat
+    return quote & value & quote
+end jsonString
+
+-- For ids, statuses and dates, which never contain characters needing escapes
+on jsonRaw(value)
+    if value is missing value then return "null"
+    return quote & (value as text) & quote
+end jsonRaw
+
+on jsonArray(jsonItems)
+    set AppleScript's text item delimiters to ","
+    set output to "[" & (jsonItems as text) & "]"
+    set AppleScript's text item delimiters to ""
+    return output
+end jsonArray
+'''
+
+# Read scripts; each returns a JSON array of objects built with the handlers above
+_LIST_TASKS_SCRIPT = _JSON_HANDLERS + r'''
+on invoke(argv)
+    set listName to item 1 of argv
+    set maxCount to (item 2 of argv) as integer
+    set includeNotes to (item 3 of argv) is "true"
+    set taskList to {}
+    tell application "Things3"
+        -- Only ask Things for the to dos that will be returned
+        set todoCount to count of to dos of list listName
+        if todoCount > maxCount then set todoCount to maxCount
+        if todoCount > 0 then
+            set todoList to to dos 1 thru todoCount of list listName
+        else
+            set todoList to {}
+        end if
+        repeat with thisToDo in todoList
+            set taskJson to "{\"title\":" & my jsonString(name of thisToDo) & ¬
+                ",\"id\":" & my jsonRaw(id of thisToDo) & ¬
+                ",\"due_date\":" & my jsonRaw(due date of thisToDo) & ¬
+                ",\"status\":" & my jsonRaw((status of thisToDo) as text)
+            -- Notes can be long, so they are only sent when asked for
+            if includeNotes then
+                set taskJson to taskJson & ",\"notes\":" & my jsonString(notes of thisToDo)
+            end if
+            set end of taskList to taskJson & "}"
+        end repeat
+    end tell
+    return my jsonArray(taskList)
+end invoke
+'''
+
+_SEARCH_TASKS_SCRIPT = _JSON_HANDLERS + r'''
+on invoke(argv)
+    set searchQuery to item 1 of argv
+    set maxCount to (item 2 of argv) as integer
+    set searchResults to {}
+    tell application "Things3"
+        -- Things evaluates the filter once; only the first maxCount matches are used
+        set matchingToDos to to dos whose name contains searchQuery or notes contains searchQuery
+        if (count of matchingToDos) > maxCount then set matchingToDos to items 1 thru maxCount of matchingToDos
+        repeat with thisToDo in matchingToDos
+            set end of searchResults to "{\"title\":" & my jsonString(name of thisToDo) & ¬
+                ",\"id\":" & my jsonRaw(id of thisToDo) & ¬
+                ",\"status\":" & my jsonRaw((status of thisToDo) as text) & "}"
+        end repeat
+    end tell
+    return my jsonArray(searchResults)
+end invoke
+'''
+
+_OVERVIEW_TASKS_SCRIPT = _JSON_HANDLERS + r'''
+on invoke(argv)
+    set taskList to {}
+    tell application "Things3"
+        repeat with thisToDo in to dos of list (item 1 of argv)
+            set end of taskList to "{\"title\":" & my jsonString(name of thisToDo) & ¬
+                ",\"due_date\":" & my jsonRaw(due date of thisToDo) & "}"
+        end repeat
+    end tell
+    return my jsonArray(taskList)
+end invoke
+'''
+
+_ACTIVE_PROJECTS_SCRIPT = _JSON_HANDLERS + r'''
+on invoke(argv)
+    set projectList to {}
+    tell application "Things3"
+        repeat with thisProject in (projects whose status is open)
+            set projectTasks to to dos of thisProject whose status is open
+            set end of projectList to "{\"title\":" & my jsonString(name of thisProject) & ¬
+                ",\"task_count\":" & (count of projectTasks) & "}"
+        end repeat
+    end tell
+    return my jsonArray(projectList)
+end invoke
+'''
+
+
+# Tool list names mapped to the Things 3 lists they read from
+_LIST_MAPPING = {
+    "today": "Today",
+    "upcoming": "Upcoming",
+    "anytime": "Anytime",
+    "someday": "Someday",
+    "inbox": "Inbox",
+    "completed": "Logbook"
+}
+
+# Project status names mapped to the `whose` clause selecting them
+_STATUS_FILTER = {
+    "open": "whose status is open",
+    "completed": "whose status is completed",
+    "all": ""
+}
+
+# list_projects script with a %s placeholder for the status filter
+_LIST_PROJECTS_TEMPLATE = _JSON_HANDLERS + r'''
+on invoke(argv)
+    set projectList to {}
+    tell application "Things3"
+        repeat with thisProject in (projects %s)
+            set end of projectList to "{\"title\":" & my jsonString(name of thisProject) & ¬
+                ",\"id\":" & my jsonRaw(id of thisProject) & ¬
+                ",\"status\":" & my jsonRaw((status of thisProject) as text) & "}"
+        end repeat
+    end tell
+    return my jsonArray(projectList)
+end invoke
+'''
+
+# One list_projects script per status, filled in once at import
+_LIST_PROJECTS_SCRIPTS = {
+    status: _LIST_PROJECTS_TEMPLATE % status_filter
+    for status, status_filter in _STATUS_FILTER.items()
+}
+
+# Maximum number of osascript workers running scripts at the same time;
+# Things 3 handles AppleEvents one by one, so more would only queue up
+_MAX_WORKERS = 4
+
+# Largest single line a worker may print; each result comes back on one line,
+# so this has to fit whole task lists rather than asyncio's 64 KiB default
+_WORKER_LINE_LIMIT = 64 * 1024 * 1024
+
+# How long (in seconds) read results are reused before asking Things 3 again
+_CACHE_TTL = 30.0
+
+
+def _cached(ttl: float):
+    """Cache a controller read method's result per arguments for ttl seconds"""
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            # Bind to the signature so positional, keyword and defaulted
+            # arguments for the same call all map to one key
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(bound.arguments.items())[1:]
+            
+            # The mutation version makes results fetched before a write unreachable
+            key = (method.__name__, self._mutation_version, arguments)
+            now = time.monotonic()
+            hit = self._cache.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return hit[1]
+            
+            value = await method(self, *args, **kwargs)
+            
+            # Drop expired entries so read-only sessions don't keep every
+            # distinct query around for the life of the process
+            self._cache = {
+                cached_key: entry for cached_key, entry in self._cache.items()
+                if now - entry[0] < ttl
+            }
+            self._cache[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def _invalidates_cache(method):
+    """Drop cached read results once a controller write method has run"""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._mutation_version += 1
+            self._cache = {}
+    return wrapper
+
+
+@dataclass
+class _Worker:
+    """An interactive osascript process and the scripts compiled into it"""
+    proc: asyncio.subprocess.Process
+    compiled: Set[str] = None
+
+    def __post_init__(self):
+        if self.compiled is None:
+            self.compiled = set()
+
+
 class Things3Controller:
     """Handles AppleScript communication with Things 3"""
     
+    def __init__(self):
+        # Long-lived `osascript -i` processes, started on demand up to
+        # _MAX_WORKERS and kept here while not running a script
+        self._idle_workers: List[_Worker] = []
+        self._worker_slots = asyncio.Semaphore(_MAX_WORKERS)
+        
+        # Fixed script text -> variable holding its compiled script object in
+        # each worker; the scripts are module/method constants, so this stays small
+        self._script_names: Dict[str, str] = {}
+        
+        # Read results keyed by (method, mutation version, arguments)
+        self._cache: Dict[tuple, tuple[float, Any]] = {}
+        self._mutation_version = 0
+
+    async def _start_worker(self) -> _Worker:
+        """Start the interactive osascript worker"""
+        proc = await asyncio.create_subprocess_exec(
+            "osascript", "-i",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            # osascript reports errors in the request line itself (e.g. a
+            # compile error) on stderr, so fold it into the output we read
+            stderr=asyncio.subprocess.STDOUT,
+            limit=_WORKER_LINE_LIMIT
+        )
+        return _Worker(proc)
+
     @staticmethod
-    def execute_applescript(script: str) -> str:
-        """Execute AppleScript and return result"""
+    def _stop_worker(worker: _Worker):
+        """Kill an osascript worker that can no longer be reused"""
+        if worker.proc.returncode is None:
+            worker.proc.kill()
+
+    @staticmethod
+    async def _exchange(worker: _Worker, name: str, script: str, args: tuple) -> str:
+        """Run a script's tagged handler in the worker and read its output up to the sentinel"""
+        sentinel = f"<<END:{uuid.uuid4().hex}>>"
+        
+        # Interactive mode evaluates one line at a time, so the first use of
+        # a script in this worker compiles it from a string literal into a
+        # script object kept in a session variable; later calls only invoke it
+        request = []
+        if name not in worker.compiled:
+            source = f"script\n{script}\n{_TAGGED_HANDLER}\nend script"
+            request.append(f"set {name} to run script {_applescript_string(source)}")
+        parameters = ", ".join(_applescript_string(str(value)) for value in args)
+        request.append(f"{name}'s tagged({{{parameters}}})")
+        request.append(f'"{sentinel}"')
+        worker.proc.stdin.write(("\n".join(request) + "\n").encode())
+        await worker.proc.stdin.drain()
+        
+        lines = []
+        while True:
+            line = await worker.proc.stdout.readline()
+            if not line:
+                raise Exception("osascript worker exited unexpectedly")
+            line = line.decode()
+            if sentinel in line:
+                return "".join(lines)
+            lines.append(line)
+
+    async def execute_applescript(self, script: str, *args: Any) -> str:
+        """Execute AppleScript, passing args as strings to its invoke handler, and return result"""
+        name = self._script_names.setdefault(script, f"script{len(self._script_names) + 1}")
         try:
-            # Escape quotes in the script
-            escaped_script = script.replace("'", "'\"'\"'")
-            
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            async with self._worker_slots:
+                worker = self._idle_workers.pop() if self._idle_workers else None
+                if worker is None or worker.proc.returncode is not None:
+                    worker = await self._start_worker()
+                
+                try:
+                    output = await asyncio.wait_for(self._exchange(worker, name, script, args), timeout=10)
+                except BaseException:
+                    # The worker's output is no longer in step with our requests
+                    self._stop_worker(worker)
+                    raise
+                
+                if _RESULT_OK not in output and _RESULT_ERR not in output:
+                    # Neither marker means the request line itself failed, so
+                    # the script object may not exist in this worker
+                    self._stop_worker(worker)
+                else:
+                    worker.compiled.add(name)
+                    self._idle_workers.append(worker)
             
-            if result.returncode != 0:
-                raise Exception(f"AppleScript error: {result.stderr}")
+            _, ok, result = output.partition(_RESULT_OK)
+            if not ok:
+                _, err, message = output.partition(_RESULT_ERR)
+                # Without either marker, whatever osascript printed is the error
+                detail = (message if err else output).strip() or "no output from osascript"
+                raise Exception(f"AppleScript error: {detail}")
             
-            return result.stdout.strip()
+            return result.strip()
         
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             raise Exception("AppleScript execution timed out")
-        except Exception as e:
+        except OSError as e:
+            # Starting the worker or talking to it over its pipes failed
             raise Exception(f"Failed to execute AppleScript: {str(e)}")
 
-    def add_task(self, title: str, notes: str = "", due_date: str = None, 
+    @_invalidates_cache
+    async def add_task(self, title: str, notes: str = "", due_date: str = None, 
                  area: str = None, project: str = None, tags: List[str] = None) -> str:
         """Add a new task to Things 3"""
         
-        # Build the AppleScript
-        script_parts = [
-            'tell application "Things3"',
-            f'    set newToDo to make new to do with properties {{name:"{title}"'
-        ]
-        
-        if notes:
-            script_parts[-1] += f', notes:"{notes}"'
-        
-        if due_date:
-            script_parts[-1] += f', due date:date("{due_date}")'
-        
-        if area:
-            script_parts[-1] += f', area:"{area}"'
-        
-        if project:
-            script_parts[-1] += f', project:"{project}"'
-        
-        script_parts[-1] += '}'
-        
-        # Add tags if provided
-        if tags:
-            script_parts.append('    repeat with tagName in {"' + '", "'.join(tags) + '"}')
-            script_parts.append('        set tag of newToDo to tagName')
-            script_parts.append('    end repeat')
-        
-        script_parts.extend([
-            '    return id of newToDo',
-            'end tell'
-        ])
+        # Optional fields arrive as empty strings; tags as one comma-separated
+        # string, which Things 3 accepts for `tag names` in a single set. All
+        # properties are collected before `make` so a bad value (e.g. an
+        # unparseable date) fails without leaving a half-filled to do behind
+        script = '''
+        on invoke(argv)
+            tell application "Things3"
+                set taskProperties to {name:item 1 of argv, notes:item 2 of argv, tag names:item 6 of argv}
+                if item 3 of argv is not "" then ¬
+                    set taskProperties to taskProperties & {due date:date (item 3 of argv)}
+                if item 4 of argv is not "" then set taskProperties to taskProperties & {area:item 4 of argv}
+                if item 5 of argv is not "" then set taskProperties to taskProperties & {project:item 5 of argv}
+                set newToDo to make new to do with properties taskProperties
+                return id of newToDo
+            end tell
+        end invoke
+        '''
         
-        script = '\n'.join(script_parts)
-        return self.execute_applescript(script)
+        return await self.execute_applescript(
+            script, title, notes or "", due_date or "", area or "", project or "", ", ".join(tags or [])
+        )
 
-    def list_tasks(self, list_name: str = "today", limit: int = 20) -> List[Dict[str, Any]]:
+    @_cached(_CACHE_TTL)
+    async def list_tasks(self, list_name: str = "today", limit: int = 20,
+                         include_notes: bool = False) -> List[Dict[str, Any]]:
         """List tasks from a specific Things 3 list"""
         
-        list_mapping = {
-            "today": 'list "Today"',
-            "upcoming": 'list "Upcoming"',
-            "anytime": 'list "Anytime"',
-            "someday": 'list "Someday"',
-            "inbox": 'list "Inbox"',
-            "completed": 'list "Logbook"'
-        }
+        things_list = _LIST_MAPPING.get(list_name.lower(), "Today")
         
-        things_list = list_mapping.get(list_name.lower(), 'list "Today"')
-        
-        script = f'''
-        tell application "Things3"
-            set taskList to {{}}
-            set todoList to to dos of {things_list}
-            repeat with i from 1 to (count of todoList)
-                if i > {limit} then exit repeat
-                set thisToDo to item i of todoList
-                set taskInfo to (name of thisToDo) & "|||" & (id of thisToDo) & "|||" & ¬
-                    (notes of thisToDo) & "|||" & (due date of thisToDo) & "|||" & ¬
-                    (creation date of thisToDo) & "|||" & (status of thisToDo)
-                set end of taskList to taskInfo
-            end repeat
-            return taskList as string
-        end tell
-        '''
-        
-        result = self.execute_applescript(script)
-        if not result or result == "":
+        result = await self.execute_applescript(
+            _LIST_TASKS_SCRIPT, things_list, int(limit), "true" if include_notes else "false"
+        )
+        if not result:
             return []
         
-        tasks = []
-        for task_line in result.split(','):
-            if '|||' in task_line:
-                parts = task_line.split('|||')
-                if len(parts) >= 6:
-                    tasks.append({
-                        'title': parts[0].strip(),
-                        'id': parts[1].strip(),
-                        'notes': parts[2].strip() if parts[2].strip() != 'missing value' else '',
-                        'due_date': parts[3].strip() if parts[3].strip() != 'missing value' else None,
-                        'creation_date': parts[4].strip() if parts[4].strip() != 'missing value' else None,
-                        'status': parts[5].strip()
-                    })
-        
-        return tasks
-
-    def complete_task(self, task_identifier: str) -> str:
+        return _json_loads(result)
+
+    @_invalidates_cache
+    async def complete_task(self, task_identifier: str) -> str:
         """Complete a task by ID or title"""
         
-        script = f'''
-        tell application "Things3"
-            try
-                set completedToDo to to do id "{task_identifier}"
-                set status of completedToDo to completed
-                return "Task completed successfully (found by ID)"
-            on error
+        script = '''
+        on invoke(argv)
+            set taskIdentifier to item 1 of argv
+            tell application "Things3"
                 try
-                    set completedToDo to to do "{task_identifier}"
+                    set completedToDo to to do id taskIdentifier
                     set status of completedToDo to completed
-                    return "Task completed successfully (found by title)"
+                    return "Task completed successfully (found by ID)"
                 on error
-                    return "Task not found: {task_identifier}"
+                    try
+                        set completedToDo to to do taskIdentifier
+                        set status of completedToDo to completed
+                        return "Task completed successfully (found by title)"
+                    on error
+                        return "Task not found: " & taskIdentifier
+                    end try
                 end try
-            end try
-        end tell
+            end tell
+        end invoke
         '''
         
-        return self.execute_applescript(script)
+        return await self.execute_applescript(script, task_identifier)
 
-    def search_tasks(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    @_cached(_CACHE_TTL)
+    async def search_tasks(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search for tasks containing the query string"""
         
-        script = f'''
-        tell application "Things3"
-            set searchResults to {{}}
-            set allToDos to to dos
-            repeat with thisToDo in allToDos
-                if (name of thisToDo) contains "{query}" or (notes of thisToDo) contains "{query}" then
-                    set taskInfo to (name of thisToDo) & "|||" & (id of thisToDo) & "|||" & (status of thisToDo)
-                    set end of searchResults to taskInfo
-                    if (count of searchResults) ≥ {limit} then exit repeat
-                end if
-            end repeat
-            return searchResults as string
-        end tell
-        '''
-        
-        result = self.execute_applescript(script)
+        result = await self.execute_applescript(_SEARCH_TASKS_SCRIPT, query, int(limit))
         if not result:
             return []
         
-        tasks = []
-        for task_line in result.split(','):
-            if '|||' in task_line:
-                parts = task_line.split('|||')
-                if len(parts) >= 3:
-                    tasks.append({
-                        'title': parts[0].strip(),
-                        'id': parts[1].strip(),
-                        'status': parts[2].strip()
-                    })
-        
-        return tasks
+        return _json_loads(result)
 
-    def list_projects(self, status: str = "open") -> List[Dict[str, Any]]:
+    @_cached(_CACHE_TTL)
+    async def list_projects(self, status: str = "open") -> List[Dict[str, Any]]:
         """List projects by status"""
         
-        status_filter = ""
-        if status == "open":
-            status_filter = "whose status is open"
-        elif status == "completed":
-            status_filter = "whose status is completed"
-        
-        script = f'''
-        tell application "Things3"
-            set projectList to {{}}
-            set allProjects to projects {status_filter}
-            repeat with thisProject in allProjects
-                set projectInfo to (name of thisProject) & "|||" & (id of thisProject) & "|||" & (status of thisProject)
-                set end of projectList to projectInfo
-            end repeat
-            return projectList as string
-        end tell
-        '''
+        script = _LIST_PROJECTS_SCRIPTS.get(status, _LIST_PROJECTS_SCRIPTS["all"])
         
-        result = self.execute_applescript(script)
+        result = await self.execute_applescript(script)
         if not result:
             return []
         
-        projects = []
-        for project_line in result.split(','):
-            if '|||' in project_line:
-                parts = project_line.split('|||')
-                if len(parts) >= 3:
-                    projects.append({
-                        'title': parts[0].strip(),
-                        'id': parts[1].strip(),
-                        'status': parts[2].strip()
-                    })
-        
-        return projects
+        return _json_loads(result)
 
-    def add_project(self, title: str, notes: str = "", area: str = None, when: str = "someday") -> str:
+    @_invalidates_cache
+    async def add_project(self, title: str, notes: str = "", area: str = None, when: str = "someday") -> str:
         """Add a new project to Things 3"""
         
-        script_parts = [
-            'tell application "Things3"',
-            f'    set newProject to make new project with properties {{name:"{title}"'
-        ]
-        
-        if notes:
-            script_parts[-1] += f', notes:"{notes}"'
+        script = '''
+        on invoke(argv)
+            tell application "Things3"
+                set projectProperties to {name:item 1 of argv, notes:item 2 of argv}
+                if item 3 of argv is not "" then set projectProperties to projectProperties & {area:item 3 of argv}
+                set newProject to make new project with properties projectProperties
+                if item 4 of argv is "today" then set start date of newProject to current date
+                return id of newProject
+            end tell
+        end invoke
+        '''
         
-        if area:
-            script_parts[-1] += f', area:"{area}"'
+        return await self.execute_applescript(script, title, notes or "", area or "", when or "")
+
+    async def _fetch_overview_tasks(self, things_list: str) -> List[Dict[str, Any]]:
+        """Fetch title and due date of every task in a Things 3 list"""
         
-        script_parts[-1] += '}'
+        result = await self.execute_applescript(_OVERVIEW_TASKS_SCRIPT, things_list)
+        if not result:
+            return []
         
-        if when == "today":
-            script_parts.append('    set start date of newProject to current date')
+        return _json_loads(result)
+
+    async def _fetch_today(self) -> List[Dict[str, Any]]:
+        """Fetch the tasks in the Today list for the daily overview"""
+        return await self._fetch_overview_tasks("Today")
+
+    async def _fetch_upcoming(self) -> List[Dict[str, Any]]:
+        """Fetch the tasks in the Upcoming list for the daily overview"""
+        return await self._fetch_overview_tasks("Upcoming")
+
+    async def _fetch_active_projects(self) -> List[Dict[str, Any]]:
+        """Fetch open projects with their number of open tasks"""
         
-        script_parts.extend([
-            '    return id of newProject',
-            'end tell'
-        ])
+        result = await self.execute_applescript(_ACTIVE_PROJECTS_SCRIPT)
+        if not result:
+            return []
         
-        script = '\n'.join(script_parts)
-        return self.execute_applescript(script)
+        return _json_loads(result)
 
-    def get_daily_overview(self) -> str:
+    @_cached(_CACHE_TTL)
+    async def get_daily_overview(self) -> str:
         """Get comprehensive daily overview"""
         
+        # The three queries are independent, so run them on separate workers
+        today, upcoming, projects = await asyncio.gather(
+            self._fetch_today(),
+            self._fetch_upcoming(),
+            self._fetch_active_projects()
+        )
+        
+        lines = [f"📅 TODAY ({len(today)} tasks):"]
+        for task in today:
+            if task['due_date']:
+                lines.append(f"• {task['title']} (Due: {task['due_date']})")
+            else:
+                lines.append(f"• {task['title']}")
+        
+        lines.append("")
+        lines.append(f"⏰ UPCOMING ({len(upcoming)} tasks):")
+        for task in upcoming:
+            if task['due_date']:
+                lines.append(f"• {task['title']} (Due: {task['due_date']})")
+            else:
+                lines.append(f"• {task['title']}")
+        
+        lines.append("")
+        lines.append(f"📁 ACTIVE PROJECTS ({len(projects)}):")
+        for project in projects:
+            lines.append(f"• {project['title']} ({project['task_count']} tasks)")
+        
+        return "\n".join(lines)
+
+    @_invalidates_cache
+    async def update_task(self, task_identifier: str, title: str = None, notes: str = None, 
+                   due_date: str = None, tags: List[str] = None) -> str:
+        """Update an existing task"""
+        
         script = '''
-        tell application "Things3"
-            set overview to ""
-            
-            -- Today's tasks
-            set todayTasks to to dos of list "Today"
-            set overview to overview & "📅 TODAY (" & (count of todayTasks) & " tasks):" & return
-            repeat with thisToDo in todayTasks
-                set overview to overview & "• " & (name of thisToDo)
-                if (due date of thisToDo) is not missing value then
-                    set overview to overview & " (Due: " & (due date of thisToDo) & ")"
+        on invoke(argv)
+            set taskIdentifier to item 1 of argv
+            tell application "Things3"
+                try
+                    set targetToDo to to do id taskIdentifier
+                on error
+                    try
+                        set targetToDo to to do taskIdentifier
+                    on error
+                        return "Task not found"
+                    end try
+                end try
+                
+                set updateResult to ""
+                if item 2 of argv is not "" then
+                    set name of targetToDo to item 2 of argv
+                    set updateResult to updateResult & "Title updated. "
                 end if
-                set overview to overview & return
-            end repeat
-            
-            -- Upcoming tasks
-            set upcomingTasks to to dos of list "Upcoming"
-            set overview to overview & return & "⏰ UPCOMING (" & (count of upcomingTasks) & " tasks):" & return
-            repeat with thisToDo in upcomingTasks
-                set overview to overview & "• " & (name of thisToDo)
-                if (due date of thisToDo) is not missing value then
-                    set overview to overview & " (Due: " & (due date of thisToDo) & ")"
+                if item 3 of argv is not "" then
+                    set notes of targetToDo to item 3 of argv
+                    set updateResult to updateResult & "Notes updated. "
                 end if
-                set overview to overview & return
-            end repeat
-            
-            -- Active projects
-            set openProjects to projects whose status is open
-            set overview to overview & return & "📁 ACTIVE PROJECTS (" & (count of openProjects) & "):" & return
-            repeat with thisProject in openProjects
-                set projectTasks to to dos of thisProject whose status is open
-                set overview to overview & "• " & (name of thisProject) & " (" & (count of projectTasks) & " tasks)" & return
-            end repeat
-            
-            return overview
-        end tell
+                if item 4 of argv is not "" then
+                    set due date of targetToDo to date (item 4 of argv)
+                    set updateResult to updateResult & "Due date updated. "
+                end if
+                return updateResult
+            end tell
+        end invoke
         '''
         
-        return self.execute_applescript(script)
-
-    def update_task(self, task_identifier: str, title: str = None, notes: str = None, 
-                   due_date: str = None, tags: List[str] = None) -> str:
-        """Update an existing task"""
-        
-        script_parts = [
-            'tell application "Things3"',
-            '    try',
-            f'        set targetToDo to to do id "{task_identifier}"',
-            '    on error',
-            '        try',
-            f'            set targetToDo to to do "{task_identifier}"',
-            '        on error',
-            '            return "Task not found"',
-            '        end try',
-            '    end try',
-            '    ',
-            '    set updateResult to ""'
-        ]
-        
-        if title:
-            script_parts.extend([
-                f'    set name of targetToDo to "{title}"',
-                '    set updateResult to updateResult & "Title updated. "'
-            ])
-        
-        if notes:
-            script_parts.extend([
-                f'    set notes of targetToDo to "{notes}"',
-                '    set updateResult to updateResult & "Notes updated. "'
-            ])
-        
-        if due_date:
-            script_parts.extend([
-                f'    set due date of targetToDo to date("{due_date}")',
-                '    set updateResult to updateResult & "Due date updated. "'
-            ])
-        
-        script_parts.extend([
-            '    return updateResult',
-            'end tell'
-        ])
-        
-        script = '\n'.join(script_parts)
-        return self.execute_applescript(script)
+        return await self.execute_applescript(script, task_identifier, title or "", notes or "", due_date or "")
+
+
+# Tool definitions advertised to MCP clients; built once at import
+_TOOLS = (
+    types.Tool(
+        name="add_task",
+        description="Add a new task to Things 3",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Task title"},
+                "notes": {"type": "string", "description": "Task notes (optional)"},
+                "due_date": {"type": "string", "description": "Due date in YYYY-MM-DD format (optional)"},
+                "area": {"type": "string", "description": "Area name (optional)"},
+                "project": {"type": "string", "description": "Project name (optional)"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags (optional)"},
+            },
+            "required": ["title"],
+        },
+    ),
+    types.Tool(
+        name="list_tasks",
+        description="List tasks from Things 3",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list": {
+                    "type": "string",
+                    "enum": ["today", "upcoming", "anytime", "someday", "inbox", "completed"],
+                    "description": "Which list to retrieve tasks from",
+                    "default": "today"
+                },
+                "limit": {"type": "number", "description": "Maximum number of tasks to return", "default": 20},
+                "include_notes": {"type": "boolean", "description": "Include task notes (optional)", "default": False},
+            },
+        },
+    ),
+    types.Tool(
+        name="complete_task",
+        description="Mark a task as completed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string", "description": "Task ID or title to complete"},
+            },
+            "required": ["task_id"],
+        },
+    ),
+    types.Tool(
+        name="search_tasks",
+        description="Search for tasks by keyword",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
+                "limit": {"type": "number", "description": "Maximum results", "default": 10},
+            },
+            "required": ["query"],
+        },
+    ),
+    types.Tool(
+        name="list_projects",
+        description="List projects from Things 3",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "status": {
+                    "type": "string",
+                    "enum": ["open", "completed", "all"],
+                    "description": "Project status filter",
+                    "default": "open"
+                },
+            },
+        },
+    ),
+    types.Tool(
+        name="add_project",
+        description="Add a new project to Things 3",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Project title"},
+                "notes": {"type": "string", "description": "Project notes (optional)"},
+                "area": {"type": "string", "description": "Area name (optional)"},
+                "when": {"type": "string", "description": "When to start (today, someday, etc.)"},
+            },
+            "required": ["title"],
+        },
+    ),
+    types.Tool(
+        name="get_daily_overview",
+        description="Get a comprehensive daily overview including today's tasks and upcoming items",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    types.Tool(
+        name="update_task",
+        description="Update an existing task",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string", "description": "Task ID or title to update"},
+                "title": {"type": "string", "description": "New title (optional)"},
+                "notes": {"type": "string", "description": "New notes (optional)"},
+                "due_date": {"type": "string", "description": "New due date in YYYY-MM-DD format (optional)"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "New tags (optional)"},
+            },
+            "required": ["task_id"],
+        },
+    ),
+)
 
 
 class Things3MCPServer:
@@ -383,122 +762,23 @@ class Things3MCPServer:
     def __init__(self):
         self.things3 = Things3Controller()
         self.server = Server("things3-mcp-server")
-
-    async def run(self):
-        """Run the MCP server"""
+        
+        # Tool name -> coroutine handling that tool's arguments
+        self._dispatch = {
+            "add_task": self._do_add_task,
+            "list_tasks": self._do_list_tasks,
+            "complete_task": self._do_complete_task,
+            "search_tasks": self._do_search_tasks,
+            "list_projects": self._do_list_projects,
+            "add_project": self._do_add_project,
+            "get_daily_overview": self._do_get_daily_overview,
+            "update_task": self._do_update_task
+        }
         
         @self.server.list_tools()
         async def handle_list_tools() -> list[types.Tool]:
             """List available tools"""
-            return [
-                types.Tool(
-                    name="add_task",
-                    description="Add a new task to Things 3",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string", "description": "Task title"},
-                            "notes": {"type": "string", "description": "Task notes (optional)"},
-                            "due_date": {"type": "string", "description": "Due date in YYYY-MM-DD format (optional)"},
-                            "area": {"type": "string", "description": "Area name (optional)"},
-                            "project": {"type": "string", "description": "Project name (optional)"},
-                            "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags (optional)"},
-                        },
-                        "required": ["title"],
-                    },
-                ),
-                types.Tool(
-                    name="list_tasks",
-                    description="List tasks from Things 3",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "list": {
-                                "type": "string",
-                                "enum": ["today", "upcoming", "anytime", "someday", "inbox", "completed"],
-                                "description": "Which list to retrieve tasks from",
-                                "default": "today"
-                            },
-                            "limit": {"type": "number", "description": "Maximum number of tasks to return", "default": 20},
-                        },
-                    },
-                ),
-                types.Tool(
-                    name="complete_task",
-                    description="Mark a task as completed",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "task_id": {"type": "string", "description": "Task ID or title to complete"},
-                        },
-                        "required": ["task_id"],
-                    },
-                ),
-                types.Tool(
-                    name="search_tasks",
-                    description="Search for tasks by keyword",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query"},
-                            "limit": {"type": "number", "description": "Maximum results", "default": 10},
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                types.Tool(
-                    name="list_projects",
-                    description="List projects from Things 3",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "status": {
-                                "type": "string",
-                                "enum": ["open", "completed", "all"],
-                                "description": "Project status filter",
-                                "default": "open"
-                            },
-                        },
-                    },
-                ),
-                types.Tool(
-                    name="add_project",
-                    description="Add a new project to Things 3",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string", "description": "Project title"},
-                            "notes": {"type": "string", "description": "Project notes (optional)"},
-                            "area": {"type": "string", "description": "Area name (optional)"},
-                            "when": {"type": "string", "description": "When to start (today, someday, etc.)"},
-                        },
-                        "required": ["title"],
-                    },
-                ),
-                types.Tool(
-                    name="get_daily_overview",
-                    description="Get a comprehensive daily overview including today's tasks and upcoming items",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                    },
-                ),
-                types.Tool(
-                    name="update_task",
-                    description="Update an existing task",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "task_id": {"type": "string", "description": "Task ID or title to update"},
-                            "title": {"type": "string", "description": "New title (optional)"},
-                            "notes": {"type": "string", "description": "New notes (optional)"},
-                            "due_date": {"type": "string", "description": "New due date in YYYY-MM-DD format (optional)"},
-                            "tags": {"type": "array", "items": {"type": "string"}, "description": "New tags (optional)"},
-                        },
-                        "required": ["task_id"],
-                    },
-                ),
-            ]
+            return list(_TOOLS)
 
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict | None) -> list[types.TextContent]:
@@ -508,97 +788,116 @@ class Things3MCPServer:
                 arguments = {}
 
             try:
-                if name == "add_task":
-                    task_id = self.things3.add_task(
-                        title=arguments["title"],
-                        notes=arguments.get("notes", ""),
-                        due_date=arguments.get("due_date"),
-                        area=arguments.get("area"),
-                        project=arguments.get("project"),
-                        tags=arguments.get("tags", [])
-                    )
-                    return [types.TextContent(type="text", text=f"Task '{arguments['title']}' added successfully with ID: {task_id}")]
-
-                elif name == "list_tasks":
-                    tasks = self.things3.list_tasks(
-                        list_name=arguments.get("list", "today"),
-                        limit=arguments.get("limit", 20)
-                    )
-                    
-                    if not tasks:
-                        return [types.TextContent(type="text", text=f"No tasks found in {arguments.get('list', 'today')} list")]
-                    
-                    result = f"Found {len(tasks)} tasks in {arguments.get('list', 'today')}:\n\n"
-                    for task in tasks:
-                        result += f"• {task['title']}"
-                        if task['due_date']:
-                            result += f" (Due: {task['due_date']})"
-                        if task['notes']:
-                            result += f"\n  Notes: {task['notes']}"
-                        result += "\n"
-                    
-                    return [types.TextContent(type="text", text=result)]
-
-                elif name == "complete_task":
-                    result = self.things3.complete_task(arguments["task_id"])
-                    return [types.TextContent(type="text", text=result)]
-
-                elif name == "search_tasks":
-                    tasks = self.things3.search_tasks(
-                        query=arguments["query"],
-                        limit=arguments.get("limit", 10)
-                    )
-                    
-                    if not tasks:
-                        return [types.TextContent(type="text", text=f"No tasks found matching '{arguments['query']}'")]
-                    
-                    result = f"Found {len(tasks)} tasks matching '{arguments['query']}':\n\n"
-                    for task in tasks:
-                        result += f"• {task['title']} ({task['status']})\n"
-                    
-                    return [types.TextContent(type="text", text=result)]
-
-                elif name == "list_projects":
-                    projects = self.things3.list_projects(status=arguments.get("status", "open"))
-                    
-                    if not projects:
-                        return [types.TextContent(type="text", text=f"No {arguments.get('status', 'open')} projects found")]
-                    
-                    result = f"Found {len(projects)} {arguments.get('status', 'open')} projects:\n\n"
-                    for project in projects:
-                        result += f"• {project['title']}\n"
-                    
-                    return [types.TextContent(type="text", text=result)]
-
-                elif name == "add_project":
-                    project_id = self.things3.add_project(
-                        title=arguments["title"],
-                        notes=arguments.get("notes", ""),
-                        area=arguments.get("area"),
-                        when=arguments.get("when", "someday")
-                    )
-                    return [types.TextContent(type="text", text=f"Project '{arguments['title']}' created successfully with ID: {project_id}")]
-
-                elif name == "get_daily_overview":
-                    overview = self.things3.get_daily_overview()
-                    return [types.TextContent(type="text", text=overview)]
-
-                elif name == "update_task":
-                    result = self.things3.update_task(
-                        task_identifier=arguments["task_id"],
-                        title=arguments.get("title"),
-                        notes=arguments.get("notes"),
-                        due_date=arguments.get("due_date"),
-                        tags=arguments.get("tags")
-                    )
-                    return [types.TextContent(type="text", text=result if result else "Task updated successfully")]
-
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
+                return await handler(arguments)
 
             except Exception as e:
                 return [types.TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
 
+    async def _do_add_task(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the add_task tool"""
+        title = arguments["title"]
+        task_id = await self.things3.add_task(
+            title=title,
+            notes=arguments.get("notes", ""),
+            due_date=arguments.get("due_date"),
+            area=arguments.get("area"),
+            project=arguments.get("project"),
+            tags=arguments.get("tags", [])
+        )
+        return [types.TextContent(type="text", text=f"Task '{title}' added successfully with ID: {task_id}")]
+
+    async def _do_list_tasks(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the list_tasks tool"""
+        list_name = arguments.get("list", "today")
+        tasks = await self.things3.list_tasks(
+            list_name=list_name,
+            limit=arguments.get("limit", 20),
+            include_notes=arguments.get("include_notes", False)
+        )
+        
+        if not tasks:
+            return [types.TextContent(type="text", text=f"No tasks found in {list_name} list")]
+        
+        lines = [f"Found {len(tasks)} tasks in {list_name}:", ""]
+        for task in tasks:
+            if task['due_date']:
+                lines.append(f"• {task['title']} (Due: {task['due_date']})")
+            else:
+                lines.append(f"• {task['title']}")
+            if task.get('notes'):
+                lines.append(f"  Notes: {task['notes']}")
+        
+        return [types.TextContent(type="text", text="\n".join(lines))]
+
+    async def _do_complete_task(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the complete_task tool"""
+        result = await self.things3.complete_task(arguments["task_id"])
+        return [types.TextContent(type="text", text=result)]
+
+    async def _do_search_tasks(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the search_tasks tool"""
+        query = arguments["query"]
+        tasks = await self.things3.search_tasks(
+            query=query,
+            limit=arguments.get("limit", 10)
+        )
+        
+        if not tasks:
+            return [types.TextContent(type="text", text=f"No tasks found matching '{query}'")]
+        
+        lines = [f"Found {len(tasks)} tasks matching '{query}':", ""]
+        for task in tasks:
+            lines.append(f"• {task['title']} ({task['status']})")
+        
+        return [types.TextContent(type="text", text="\n".join(lines))]
+
+    async def _do_list_projects(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the list_projects tool"""
+        status = arguments.get("status", "open")
+        projects = await self.things3.list_projects(status=status)
+        
+        if not projects:
+            return [types.TextContent(type="text", text=f"No {status} projects found")]
+        
+        lines = [f"Found {len(projects)} {status} projects:", ""]
+        for project in projects:
+            lines.append(f"• {project['title']}")
+        
+        return [types.TextContent(type="text", text="\n".join(lines))]
+
+    async def _do_add_project(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the add_project tool"""
+        title = arguments["title"]
+        project_id = await self.things3.add_project(
+            title=title,
+            notes=arguments.get("notes", ""),
+            area=arguments.get("area"),
+            when=arguments.get("when", "someday")
+        )
+        return [types.TextContent(type="text", text=f"Project '{title}' created successfully with ID: {project_id}")]
+
+    async def _do_get_daily_overview(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the get_daily_overview tool"""
+        overview = await self.things3.get_daily_overview()
+        return [types.TextContent(type="text", text=overview)]
+
+    async def _do_update_task(self, arguments: dict) -> list[types.TextContent]:
+        """Handle the update_task tool"""
+        result = await self.things3.update_task(
+            task_identifier=arguments["task_id"],
+            title=arguments.get("title"),
+            notes=arguments.get("notes"),
+            due_date=arguments.get("due_date"),
+            tags=arguments.get("tags")
+        )
+        return [types.TextContent(type="text", text=result if result else "Task updated successfully")]
+
+    async def run(self):
+        """Run the MCP server"""
+        
         # Start the server
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             await self.server.run(